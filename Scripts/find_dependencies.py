@@ -272,7 +272,7 @@ def main():
     workflows = args.workflow
     case_sensitive = args.case
     graph_suffix = args.suffix
-    list_exclude = args.exclude
+    set_exclude = set(args.exclude) if args.exclude else set()
     n_levels = args.levels
 
     # Load all workflows from JSON files
@@ -281,7 +281,7 @@ def main():
     dic_wf_all_simple = {}
     for wf, dic_wf in dic_wf_all_full.items():
         # Skip excluded workflows
-        if list_exclude and wf in list_exclude:
+        if wf in set_exclude:
             continue
         dic_wf_all_simple[wf] = {}
         list_dev = get_devices(dic_wf)
@@ -290,9 +290,9 @@ def main():
             list_inputs = get_inputs(dic_wf, dev)
             list_outputs = get_outputs(dic_wf, dev)
             # Skip excluded tables
-            if list_exclude:
-                list_inputs = [i for i in list_inputs if i not in list_exclude]
-                list_outputs = [o for o in list_outputs if o not in list_exclude]
+            if set_exclude:
+                list_inputs = [i for i in list_inputs if i not in set_exclude]
+                list_outputs = [o for o in list_outputs if o not in set_exclude]
             dic_wf_all_simple[wf][dev]["inputs"] = list_inputs
             dic_wf_all_simple[wf][dev]["outputs"] = list_outputs
     # print_workflows(dic_wf_all_simple)